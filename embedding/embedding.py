@@ -3,28 +3,109 @@ This script applies sentence_transformer models to text columns held in Pandas d
 The output is saved in .npy format.
 """
 
-from os.path import join
+from os.path import exists, join
 import numpy as np
 import pandas as pd
+import torch
 from sentence_transformers import SentenceTransformer
 
 READ_DIR = "../data/processed"
 
 SAVE_DIR = "../data/processed"
 
-FILENAME = "twitter_airline_sentiment_cleaned_emoji_urls_html_symbols@#_quotes_currency_whitespace_3wordtweetdrop_flightspellcorrect"
+FILENAMES = [
+    "twitter_airline_sentiment_cleaned_emoji_urls_html_symbols@#_quotes_currency_whitespace_3wordtweetdrop_flightspellcorrect",
+]
 
 MODEL_NAMES = ["all-mpnet-base-v2"]
 
 TEXT_COLUMN = "clean_text"
 
+BATCH_SIZE = 128
+
+# Local model cache so repeat runs skip the HuggingFace hub round-trips
+MODEL_CACHE_DIR = "./.st_cache"
+
+
+def load_model(name: str) -> SentenceTransformer:
+    """Loads a SentenceTransformer model.
+
+    On CPU the ONNX Runtime backend is preferred: the exported graph has
+    fused attention/LayerNorm kernels and encodes several times faster
+    than the default torch backend. Falls back to torch if the optional
+    optimum/onnxruntime dependencies are not installed.
+
+    Args:
+        name: sentence-transformers model name
+
+    Returns:
+        SentenceTransformer
+    """
+    if not torch.cuda.is_available():
+        try:
+            return SentenceTransformer(
+                name, backend="onnx", cache_folder=MODEL_CACHE_DIR
+            )
+        except (ImportError, ValueError):
+            pass
+    return SentenceTransformer(name, cache_folder=MODEL_CACHE_DIR)
+
+
+def read_texts(filename: str) -> list[str]:
+    """Reads the text column of one processed data file.
+
+    Prefers a Parquet copy: the columnar read loads just the text column
+    with no re-parsing or dtype inference. Falls back to the CSV written
+    by the preprocessing notebook and caches it as Parquet for the next
+    run.
+
+    Args:
+        filename: processed data filename, without extension
+
+    Returns:
+        list of texts
+    """
+    parquet_path = join(READ_DIR, f"{filename}.parquet")
+    if exists(parquet_path):
+        df = pd.read_parquet(parquet_path, columns=[TEXT_COLUMN])
+    else:
+        df = pd.read_csv(f"{READ_DIR}/{filename}.csv")
+        df.to_parquet(parquet_path)
+    return df[TEXT_COLUMN].tolist()
+
+
 if __name__ == "__main__":
-    # Read in FILENAME as csv
-    df = pd.read_csv(f"{READ_DIR}/{FILENAME}.csv")
+    file_texts = {filename: read_texts(filename) for filename in FILENAMES}
+
+    # Concatenate all files and sort the tweets by length, so each model
+    # is loaded and warmed up once and each batch pads to a similar
+    # sequence length, minimising the compute spent on padding tokens
+    texts = [t for file in file_texts.values() for t in file]
+    order = np.argsort([len(t) for t in texts])
+    sorted_texts = [texts[i] for i in order]
+    inverse_order = np.empty_like(order)
+    inverse_order[order] = np.arange(len(order))
 
     for model in MODEL_NAMES:
-        embedding_model = SentenceTransformer(model)
-        encoded_text = embedding_model.encode(df[TEXT_COLUMN])
+        embedding_model = load_model(model)
+        # On a GPU run the forward pass in half precision: the encoder
+        # gets tensor-core throughput and half the memory traffic with
+        # no measurable change to the embeddings
+        if torch.cuda.is_available():
+            embedding_model = embedding_model.to("cuda").half()
+        encoded_text = embedding_model.encode(
+            sorted_texts,
+            batch_size=BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=True,
+        )
+        # Restore the original row order, then split the result back
+        # into one slice per input file. Half precision halves the .npy
+        # size and is ample for the downstream similarity work
+        encoded_text = encoded_text[inverse_order].astype(np.float16)
 
-        savename = FILENAME + "_" + model
-        np.save(join(SAVE_DIR, savename), encoded_text)
+        offset = 0
+        for filename, file in file_texts.items():
+            savename = filename + "_" + model
+            np.save(join(SAVE_DIR, savename), encoded_text[offset : offset + len(file)])
+            offset += len(file)
@@ -2,15 +2,112 @@
 Functions used to pre-process the Twitter posts.
 """
 
+import os
 import re
-from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+
 import pandas as pd
 from bs4 import BeautifulSoup
+
+try:
+    # selectolax's C parser is an order of magnitude faster than
+    # html.parser; fall back to BeautifulSoup if it is not installed
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 import nltk
 import emoji
 from spellchecker import SpellChecker
 from nltk.tokenize import TweetTokenizer
 
+# Patterns used in the hot per-row paths, compiled once at import.
+# This regex looks for the £, € or $ symbol followed by any number of
+# whitespace characters (\s*) and then a number (\d)
+_CURRENCY_RE = re.compile(r"([£€$])\s*(\d)")
+
+# scheme://host, host not empty and not starting a path/query/fragment
+_URL_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://[^\s/?#]")
+
+# An @mention / #hashtag and any whitespace that follows it. Kept as two
+# patterns because remove_symbols applies them sequentially, which can
+# differ from a single combined pass when removals are adjacent
+_MENTION_RE = re.compile(r"@\w+\s*")
+_HASHTAG_RE = re.compile(r"#\w+\s*")
+
+# Ordinal numbers such as 1st, 2nd, 3rd, 4th
+_ORDINAL_NUMBER_RE = re.compile(r"^\d+(st|nd|rd|th)$", re.IGNORECASE)
+
+# Shared tokenizer instance; TweetTokenizer keeps no per-call state
+_TWEET_TOKENIZER = TweetTokenizer()
+
+# Translation table mapping unicode curly quotes to ascii ones
+_CURLY_TRANS = str.maketrans(
+    {
+        "\u2018": "'",  # Left single quotation mark
+        "\u2019": "'",  # Right single quotation mark
+        "\u201C": '"',  # Left double quotation mark
+        "\u201D": '"',  # Right double quotation mark
+        "\u2033": '"',  # Double prime (often used as a double quote)
+        "\u2036": '"',  # Reversed double prime (also used as a double quote)
+    }
+)
+
+# Whitespace-delimited tokens consisting only of letters; equivalent to
+# keeping the str.split() tokens for which isalpha() is true
+_ALPHA_TOKEN_RE = re.compile(r"(?<!\S)[^\W\d_]+(?!\S)")
+
+# nltk english vocabulary, downloaded and built on first use
+_ENGLISH_VOCAB: frozenset[str] | None = None
+
+
+def _english_vocab() -> frozenset[str]:
+    global _ENGLISH_VOCAB
+    if _ENGLISH_VOCAB is None:
+        nltk.download("words")
+        _ENGLISH_VOCAB = frozenset(w.lower() for w in nltk.corpus.words.words())
+    return _ENGLISH_VOCAB
+
+
+# fix_whitespace: all of the whitespace-removal rules fused into a single
+# alternation so each string is scanned once. Alternatives are tried in
+# order, so the more specific rules must precede the generic \s+ collapse.
+_WS_FUSED_RE = re.compile(
+    # Remove space after an opening parenthesis
+    r"(?P<open_paren>\(\s+)"
+    # Remove space after a quote opening the string
+    r"|(?P<quote_start>^[\"']\s+)"
+    # Remove space before punctuation or a closing parenthesis
+    r"|(?P<drop>\s+(?=[?.!,:)]))"
+    # Remove space after an opening quote (one space is kept before it)
+    r"|(?P<quote_mid>\s+[\"']\s+)"
+    # Remove space before a quote closing the string
+    r"|(?P<quote_end>\s+[\"']$)"
+    # Collapse any other whitespace run to a single space
+    r"|(?P<ws>\s+)"
+)
+_MISSING_SPACE_PUNCT_RE = re.compile(r"([?.!])([^\s])(?=[A-Za-z])")
+_MISSING_SPACE_COMMA_RE = re.compile(r",([^\s\d])")
+
+
+def _fix_whitespace_repl(m: re.Match) -> str:
+    """Returns the replacement for a _WS_FUSED_RE match based on which
+    alternative matched."""
+    kind = m.lastgroup
+    if kind == "ws":
+        return " "
+    if kind == "drop":
+        return ""
+    if kind == "open_paren":
+        return "("
+    if kind == "quote_mid":
+        quote = m.group(0).strip()
+        # A quote ending the string loses its leading space too
+        return quote if m.end() == len(m.string) else " " + quote
+    # quote_start / quote_end
+    return m.group(0).strip()
+
 
 def replace_substring(
     df: pd.DataFrame, col: str, str_to_replace: str, replacement: str
@@ -49,8 +146,15 @@ def is_substring_after_punctuation(sentence: str, substring: str) -> bool:
     Returns:
         bool
     """
-    pattern = re.compile(rf"[.!?]\s*{re.escape(substring)}")
-    return bool(pattern.search(sentence))
+    return bool(_after_punctuation_pattern(substring).search(sentence))
+
+
+@lru_cache(maxsize=None)
+def _after_punctuation_pattern(substring: str) -> re.Pattern:
+    """Compiled pattern matching `substring` after sentence-ending
+    punctuation, cached so repeated calls (one per row in
+    replace_substring) do not recompile it."""
+    return re.compile(rf"[.!?]\s*{re.escape(substring)}")
 
 
 def find_incorrect_spellings(
@@ -70,41 +174,36 @@ def find_incorrect_spellings(
     Returns:
         pandas dataframe
     """
-    # Initialize TweetTokenizer and SpellChecker
-    tokenizer = TweetTokenizer()
     spell_checker = SpellChecker(distance=distance)
-    ordinal_number_pattern = re.compile(r"^\d+(st|nd|rd|th)$", re.IGNORECASE)
-
-    processed_text = []
-    # Cache suggestions to avoid re-computing corrections
-    suggestions_dict = {}
-    # Process each string in the series
-    for t in df[col]:
-        # Tokenize the string using TweetTokenizer
-        tokens = tokenizer.tokenize(t)
-        # Reduce to list of unknown words
-        tokens = spell_checker.unknown(tokens)
-        # Store the unusual spellings and potential corrections in a dict
-        unusual_spellings = {}
-        for token in tokens:
-            if (
-                token.startswith("@")
-                or token.startswith("#")
-                or not token.isascii()
-                or ordinal_number_pattern.match(token)
-            ):
-                continue
-            elif token in suggestions_dict:
-                unusual_spellings[token] = suggestions_dict[token]
-            else:
-                spell_checked = spell_checker.correction(token)
-                if token != spell_checked:
-                    unusual_spellings[token] = spell_checked
-                    suggestions_dict[token] = spell_checked
-
-        processed_text.append(unusual_spellings)
-
-    df["check_spellings"] = processed_text
+
+    # Tokenize every row once, then spell-check each unique unknown token
+    # once for the whole corpus: correction() explores the edit-distance
+    # neighbourhood of a word, so running it per unique token instead of
+    # per occurrence is the dominant saving here
+    tokenized = _TWEET_TOKENIZER.tokenize_sents(list(df[col]))
+    corrections = {}
+    for token in spell_checker.unknown(set(chain.from_iterable(tokenized))):
+        if (
+            token.startswith("@")
+            or token.startswith("#")
+            or not token.isascii()
+            or _ORDINAL_NUMBER_RE.match(token)
+        ):
+            continue
+        spell_checked = spell_checker.correction(token)
+        if token != spell_checked:
+            corrections[token] = spell_checked
+
+    # Per row the unusual spellings are now plain dict lookups; unknown()
+    # lower-cases tokens, so match that before looking them up
+    df["check_spellings"] = [
+        {
+            token: corrections[token]
+            for token in {t.lower() for t in tokens}
+            if token in corrections
+        }
+        for tokens in tokenized
+    ]
     return df
 
 
@@ -119,14 +218,10 @@ def unusual_words(df: pd.DataFrame, col: str) -> pd.DataFrame:
     Returns:
         pandas dataframe
     """
-    nltk.download("words")
-    english_vocab = set(w.lower() for w in nltk.corpus.words.words())
-    processed_text = []
-    for text in df[col]:
-        text_vocab = set(w.lower() for w in text.split() if w.isalpha())
-        unusual = text_vocab - english_vocab
-        processed_text.append(sorted(unusual))
-    df["unusual_words"] = processed_text
+    english_vocab = _english_vocab()
+    # One C-level scan per row instead of split() + per-token isalpha()
+    tokens = df[col].str.lower().str.findall(_ALPHA_TOKEN_RE)
+    df["unusual_words"] = [sorted(set(toks) - english_vocab) for toks in tokens]
     return df
 
 
@@ -142,16 +237,27 @@ def remove_emoji(df: pd.DataFrame, col: str, replace: bool = False) -> pd.DataFr
         pandas dataframe
     """
 
-    processed_text = []
+    if replace:
+        df[col] = df[col].map(_demojize_one)
+    else:
+        # Plain removal doesn't need the library's per-codepoint walk;
+        # one compiled scan over its emoji set does the same job
+        df[col] = df[col].str.replace(_emoji_pattern(), "", regex=True)
+    return df
 
-    for t in df[col]:
-        if replace:
-            processed_text.append(emoji.demojize(t, delimiters=(" ", " ")))
-        else:
-            processed_text.append(emoji.replace_emoji(t, replace=""))
 
-    df[col] = processed_text
-    return df
+# Pattern matching every emoji sequence the emoji library knows, built
+# lazily because EMOJI_DATA is large; longest-first so multi-codepoint
+# sequences are removed whole
+_EMOJI_RE: re.Pattern | None = None
+
+
+def _emoji_pattern() -> re.Pattern:
+    global _EMOJI_RE
+    if _EMOJI_RE is None:
+        emojis = sorted(emoji.EMOJI_DATA, key=len, reverse=True)
+        _EMOJI_RE = re.compile("|".join(map(re.escape, emojis)))
+    return _EMOJI_RE
 
 
 def remove_urls(df: pd.DataFrame, col: str) -> pd.DataFrame:
@@ -165,22 +271,17 @@ def remove_urls(df: pd.DataFrame, col: str) -> pd.DataFrame:
         pandas dataframe
     """
 
-    processed_text = []
-
-    for t in df[col]:
-        words = t.split()
-        filtered_words = [word for word in words if not is_url(word)]
-        result_text = " ".join(filtered_words)
-        processed_text.append(result_text)
-
-    df[col] = processed_text
+    df[col] = df[col].map(
+        lambda t: " ".join(word for word in t.split() if not is_url(word))
+    )
     return df
 
 
-def is_url(word):
-    # Use urlparse to check if the word is a URL
-    parsed_url = urlparse(word)
-    return all([parsed_url.scheme, parsed_url.netloc])
+def is_url(word: str) -> bool:
+    # A URL here is a scheme followed by :// and a non-empty host,
+    # matching what the old urlparse scheme/netloc check accepted but
+    # without allocating a ParseResult per token
+    return _URL_RE.match(word) is not None
 
 
 def remove_html(df: pd.DataFrame, col: str) -> pd.DataFrame:
@@ -194,17 +295,20 @@ def remove_html(df: pd.DataFrame, col: str) -> pd.DataFrame:
         pandas dataframe
     """
 
-    processed_text = []
+    # Most tweets contain neither tags nor entities, so only pay the
+    # parser cost for rows that could need it. "&" is included because
+    # parsing also decodes entities such as &amp;
+    mask = df[col].str.contains(r"[<&]", regex=True)
+    # Parse the HTML content and extract the text without HTML tags
+    df.loc[mask, col] = df.loc[mask, col].map(_html_text)
+    return df
 
-    for t in df[col]:
-        # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(t, "html.parser")
-        # Extract the text without HTML tags
-        clean_text = soup.get_text(separator=" ")
-        processed_text.append(clean_text)
 
-    df[col] = processed_text
-    return df
+def _html_text(t: str) -> str:
+    """Extracts the text content of one string of HTML."""
+    if HTMLParser is not None:
+        return HTMLParser(t).text(separator=" ")
+    return BeautifulSoup(t, "html.parser").get_text(separator=" ")
 
 
 def remove_symbols(
@@ -239,22 +343,35 @@ def remove_symbols(
     ):
         raise ValueError("remove_keyword must be a bool or a list of bools")
 
-    processed_text = []
-    for t in df[col]:
-        for idx, s in enumerate(symbols):
-            r = remove_keyword[idx]
-            if isinstance(r, bool) and r:
-                # Remove symbol and associated text
-                t = re.sub(s + r"\w+\s*", "", t).strip()
-            else:
-                # Remove only the symbol
-                t = re.sub(re.escape(s), "", t)
-        processed_text.append(t)
-
-    df[col] = processed_text
+    # Compile one pattern per symbol up front instead of per row: with
+    # keyword removal the symbol and its associated text, otherwise just
+    # the symbol
+    compiled = [
+        (_symbol_keyword_pattern(s) if r else _symbol_pattern(s), r)
+        for s, r in zip(symbols, remove_keyword)
+    ]
+
+    def strip_symbols(t: str) -> str:
+        for pattern, r in compiled:
+            t = pattern.sub("", t)
+            if r:
+                t = t.strip()
+        return t
+
+    df[col] = df[col].map(strip_symbols)
     return df
 
 
+@lru_cache(maxsize=None)
+def _symbol_keyword_pattern(symbol: str) -> re.Pattern:
+    return re.compile(symbol + r"\w+\s*")
+
+
+@lru_cache(maxsize=None)
+def _symbol_pattern(symbol: str) -> re.Pattern:
+    return re.compile(re.escape(symbol))
+
+
 def replace_curly_quotes(df: pd.DataFrame, col: str) -> pd.DataFrame:
     """Replaces unicode curly quotes with ascii ones
 
@@ -266,24 +383,8 @@ def replace_curly_quotes(df: pd.DataFrame, col: str) -> pd.DataFrame:
         pandas dataframe
     """
 
-    # Unicode code points for curly quotes
-    curly_quotes = {
-        "\u2018": "'",  # Left single quotation mark
-        "\u2019": "'",  # Right single quotation mark
-        "\u201C": '"',  # Left double quotation mark
-        "\u201D": '"',  # Right double quotation mark
-        "\u2033": '"',  # Double prime (often used as a double quote)
-        "\u2036": '"',  # Reversed double prime (also used as a double quote)
-    }
-
-    # Process each text in the list
-    processed_text = []
-    for t in df[col]:
-        for curly, straight in curly_quotes.items():
-            t = t.replace(curly, straight)
-        processed_text.append(t)
-
-    df[col] = processed_text
+    # The translation table replaces all six quotes in a single pass
+    df[col] = df[col].str.translate(_CURLY_TRANS)
     return df
 
 
@@ -297,19 +398,9 @@ def remove_whitespace_currency(df: pd.DataFrame, col: str) -> pd.DataFrame:
     Returns:
         pandas dataframe
     """
-    # This regex looks for the £, € or $ symbol followed by any number
-    # of whitespace characters
-    # (\s*) and then a number (\d)
-    pattern = r"([£€$])\s*(\d)"
-
-    processed_text = []
-
-    for t in df[col]:
-        # The substitution will replace the found pattern with the
-        # currency symbol immediately followed by the number with no space
-        processed_text.append(re.sub(pattern, r"\1\2", t))
-
-    df[col] = processed_text
+    # The substitution replaces the found pattern with the currency
+    # symbol immediately followed by the number with no space
+    df[col] = df[col].str.replace(_CURRENCY_RE, r"\1\2", regex=True)
     return df
 
 
@@ -325,27 +416,118 @@ def fix_whitespace(df: pd.DataFrame, col: str) -> pd.DataFrame:
         pandas dataframe
     """
 
-    processed_text = []
-
-    for t in df[col]:
-        # Remove excess whitespace
-        t = re.sub(r"\s+", " ", t)
-        # Remove space before punctuation
-        t = re.sub(r"\s+([?.!,:])", r"\1", t)
-        # Remove space after an opening parenthesis and before a closing
-        # parenthesis
-        t = re.sub(r"\(\s+", "(", t)
-        t = re.sub(r"\s+\)", ")", t)
-        # Remove space after an opening quote and before a closing quote
-        t = re.sub(r"(\s|^)(\"|\')\s", r"\1\2", t)
-        t = re.sub(r"\s(\"|\')(\s|$)", r"\1\2", t)
+    df[col] = (
+        df[col]
+        # Remove excess/misplaced whitespace in a single scan
+        .str.replace(_WS_FUSED_RE, _fix_whitespace_repl, regex=True)
         # Add space after sentence-ending punctuation if it's not there
-        t = re.sub(r"([?.!])([^\s])(?=[A-Za-z])", r"\1 \2", t)
-        # Add space after a comma if it's not there, and it's not followed by
-        # a digit
-        t = re.sub(r",([^\s\d])", r", \1", t)
-        t = t.strip()
-        processed_text.append(t)
-
-    df[col] = processed_text
+        .str.replace(_MISSING_SPACE_PUNCT_RE, r"\1 \2", regex=True)
+        # Add space after a comma if it's not there, and it's not followed
+        # by a digit
+        .str.replace(_MISSING_SPACE_COMMA_RE, r", \1", regex=True)
+        .str.strip()
+    )
+    return df
+
+
+def clean_text(
+    df: pd.DataFrame,
+    col: str,
+    batch_size: int = 2000,
+    max_workers: int | None = None,
+    use_processes: bool = True,
+) -> pd.DataFrame:
+    """Runs the full tweet-cleaning pipeline on a text column:
+    emoji replacement, URL/HTML removal, @mention and #hashtag removal,
+    quote normalisation, currency whitespace and whitespace fixes.
+
+    Rows are independent, so the column is split into batches that are
+    cleaned concurrently and reassembled in order. By default the
+    batches go to a process pool: much of the cleaning (emoji lookups,
+    regex dispatch) is pure Python and holds the GIL, so threads alone
+    cannot use more than one core. Set use_processes=False to stay in
+    one process, e.g. for small dataframes where worker start-up and
+    pickling would dominate.
+
+    Args:
+        df: pandas dataframe
+        col: column name on which to operate
+        batch_size: number of rows cleaned per task
+        max_workers: worker count, defaulting to the CPU count
+        use_processes: use a process pool rather than a thread pool
+
+    Returns:
+        pandas dataframe
+    """
+    # Pull the column out as a plain list once; the batches are then
+    # just list slices, cheap to pickle and free of per-row pandas
+    # dispatch in the workers
+    texts = df[col].tolist()
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with pool_cls(max_workers=max_workers or os.cpu_count()) as executor:
+        results = executor.map(_clean_batch, batches)
+    df[col] = list(chain.from_iterable(results))
     return df
+
+
+# The per-row equivalents of the standard cleaning steps. Fusing them
+# means each row is cleaned in one go rather than materialising an
+# intermediate column per step.
+def _demojize_one(t: str) -> str:
+    return emoji.demojize(t, delimiters=(" ", " "))
+
+
+def _remove_urls_one(t: str) -> str:
+    return " ".join(word for word in t.split() if not is_url(word))
+
+
+def _remove_html_one(t: str) -> str:
+    return _html_text(t) if "<" in t or "&" in t else t
+
+
+def _remove_mentions_hashtags_one(t: str) -> str:
+    t = _MENTION_RE.sub("", t).strip()
+    return _HASHTAG_RE.sub("", t).strip()
+
+
+def _replace_curly_quotes_one(t: str) -> str:
+    return t.translate(_CURLY_TRANS)
+
+
+def _remove_whitespace_currency_one(t: str) -> str:
+    return _CURRENCY_RE.sub(r"\1\2", t)
+
+
+def _fix_whitespace_one(t: str) -> str:
+    t = _WS_FUSED_RE.sub(_fix_whitespace_repl, t)
+    t = _MISSING_SPACE_PUNCT_RE.sub(r"\1 \2", t)
+    t = _MISSING_SPACE_COMMA_RE.sub(r", \1", t)
+    return t.strip()
+
+
+# Steps applied to each row by clean_text, in order; matches the
+# dataframe-level remove_emoji(replace=True) -> remove_urls ->
+# remove_html -> remove_symbols("@", "#") -> replace_curly_quotes ->
+# remove_whitespace_currency -> fix_whitespace chain
+_PIPELINE_STEPS = (
+    _demojize_one,
+    _remove_urls_one,
+    _remove_html_one,
+    _remove_mentions_hashtags_one,
+    _replace_curly_quotes_one,
+    _remove_whitespace_currency_one,
+    _fix_whitespace_one,
+)
+
+
+def _clean_one(t: str) -> str:
+    """Runs every pipeline step on a single string."""
+    for step in _PIPELINE_STEPS:
+        t = step(t)
+    return t
+
+
+def _clean_batch(texts: list[str]) -> list[str]:
+    """Cleans one batch of rows, finishing each row before the next."""
+    return [_clean_one(t) for t in texts]